@@ -1,6 +1,6 @@
 """Simple Othello game package."""
 
-from .board import Board, BLACK, WHITE, EMPTY, opponent
+from .board import Board, BLACK, WHITE, EMPTY, SIZE, opponent
 from .game import OthelloGame
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "BLACK",
     "WHITE",
     "EMPTY",
+    "SIZE",
     "opponent",
     "OthelloGame",
 ]
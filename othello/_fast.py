@@ -0,0 +1,289 @@
+"""Bitboard kernels for move generation and search.
+
+Boards are passed as a pair of 64-bit bitboards from the point of view of the
+side to move (``own``) and its opponent (``opp``); bit ``row * 8 + col`` is set
+when that square holds a disc. The kernels are compiled with numba when it is
+installed and run as plain Python otherwise.
+"""
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+    int64 = int
+    uint64 = int
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        def decorate(func):
+            return func
+
+        return decorate
+
+else:
+    HAVE_NUMBA = True
+    int64 = np.int64
+    uint64 = np.uint64
+
+
+def int_table(values: Sequence[int]):
+    """Return ``values`` in a form the kernels can index (an array under numba)."""
+    if HAVE_NUMBA:
+        return np.array(values, dtype=np.int64)
+    return tuple(values)
+
+
+def uint_table(values: Sequence[int]):
+    """Like :func:`int_table` for unsigned 64-bit values such as bitboards."""
+    if HAVE_NUMBA:
+        return np.array(values, dtype=np.uint64)
+    return tuple(values)
+
+
+def weight_classes(square_weights: Sequence[int]):
+    """Group 64 per-square weights into ``(weights, masks)`` tables for :func:`evaluate`.
+
+    Squares sharing a weight are collected into one bitboard, so a board is
+    scored with one pair of popcounts per distinct weight rather than a
+    visit to every square. Zero weights are dropped.
+    """
+    masks: Dict[int, int] = {}
+    for square, weight in enumerate(square_weights):
+        if weight:
+            masks[weight] = masks.get(weight, 0) | (1 << square)
+    return int_table(list(masks)), uint_table(list(masks.values()))
+
+
+MASK64 = uint64(0xFFFFFFFFFFFFFFFF)
+# Masks clearing the "a" (col 0) and "h" (col 7) files, used to stop
+# horizontal and diagonal shifts from wrapping onto the neighbouring row.
+NOT_A = uint64(0xFEFEFEFEFEFEFEFE)
+NOT_H = uint64(0x7F7F7F7F7F7F7F7F)
+
+# Each shift amount covers a pair of opposite directions: E/W (1),
+# SW/NE (7), S/N (8) and SE/NW (9). Left shifts move towards higher squares.
+_SHIFTS = (uint64(1), uint64(7), uint64(8), uint64(9))
+_LEFT_MASKS = (NOT_A, NOT_H, MASK64, NOT_A)
+_RIGHT_MASKS = (NOT_H, NOT_A, MASK64, NOT_H)
+
+# Rays from each square to the edge of the board. A capture needs at least
+# two squares along a ray (an opponent disc and a closing disc), so only rays
+# that long are kept, packed per square so the flip loop never visits one
+# that runs off the board. ``_UP_RAYS[square * 4 + k]`` for
+# ``k < _UP_COUNTS[square]`` are the rays heading towards higher squares
+# (E, SW, S, SE); ``_DOWN_RAYS`` and ``_DOWN_COUNTS`` hold those heading
+# towards lower squares (W, NE, N, NW).
+_UP_DIRECTIONS = ((0, 1), (1, -1), (1, 0), (1, 1))
+_DOWN_DIRECTIONS = ((0, -1), (-1, 1), (-1, 0), (-1, -1))
+
+
+def _build_rays(directions):
+    rays = []
+    counts = []
+    for square in range(64):
+        square_rays = []
+        for d_row, d_col in directions:
+            row, col = divmod(square, 8)
+            ray = 0
+            length = 0
+            row, col = row + d_row, col + d_col
+            while 0 <= row < 8 and 0 <= col < 8:
+                ray |= 1 << (row * 8 + col)
+                row, col = row + d_row, col + d_col
+                length += 1
+            if length >= 2:
+                square_rays.append(ray)
+        counts.append(len(square_rays))
+        rays.extend(square_rays + [0] * (4 - len(square_rays)))
+    return uint_table(rays), int_table(counts)
+
+
+_UP_RAYS, _UP_COUNTS = _build_rays(_UP_DIRECTIONS)
+_DOWN_RAYS, _DOWN_COUNTS = _build_rays(_DOWN_DIRECTIONS)
+
+# Move ordering tiers: corners first, then squares not adjacent to a corner,
+# then the C and X squares next to the corners.
+_CORNERS = uint64(0x8100000000000081)
+_CORNER_NEIGHBOURS = uint64(0x42C300000000C342)
+_ORDER = (_CORNERS, MASK64 ^ _CORNERS ^ _CORNER_NEIGHBOURS, _CORNER_NEIGHBOURS)
+
+# Finished games are scored by disc margin, weighted so that any win outranks
+# every positional evaluation.
+FINAL_DISC_WEIGHT = 1000
+INFINITY = 1 << 30
+
+
+@njit("int64(uint64)", cache=True, nogil=True)
+def popcount(bb):
+    bb = bb - ((bb >> uint64(1)) & uint64(0x5555555555555555))
+    bb = (bb & uint64(0x3333333333333333)) + ((bb >> uint64(2)) & uint64(0x3333333333333333))
+    bb = (bb + (bb >> uint64(4))) & uint64(0x0F0F0F0F0F0F0F0F)
+    return int64(((bb * uint64(0x0101010101010101)) & MASK64) >> uint64(56))
+
+
+@njit("uint64(uint64, uint64)", cache=True, nogil=True)
+def valid_moves_bb(own, opp):
+    """Return the bitboard of legal moves for the player owning ``own``.
+
+    Uses a Dumb7Fill flood along each direction: runs of opponent discs
+    adjacent to our own discs are grown one step at a time (at most six
+    opponent discs fit between two squares), and the empty square just past
+    the end of a run is a legal move.
+    """
+
+    empty = ~(own | opp) & MASK64
+    moves = uint64(0)
+    for i in range(4):
+        shift = _SHIFTS[i]
+        left = _LEFT_MASKS[i]
+        right = _RIGHT_MASKS[i]
+
+        run = opp & (own << shift) & left
+        run |= opp & (run << shift) & left
+        run |= opp & (run << shift) & left
+        run |= opp & (run << shift) & left
+        run |= opp & (run << shift) & left
+        run |= opp & (run << shift) & left
+        moves |= (run << shift) & left
+
+        run = opp & (own >> shift) & right
+        run |= opp & (run >> shift) & right
+        run |= opp & (run >> shift) & right
+        run |= opp & (run >> shift) & right
+        run |= opp & (run >> shift) & right
+        run |= opp & (run >> shift) & right
+        moves |= (run >> shift) & right
+    return moves & empty
+
+
+@njit("UniTuple(int64, 2)(uint64, uint64)", cache=True, nogil=True)
+def mobility(own, opp):
+    """Return the number of legal moves for both players as ``(own, opp)``.
+
+    Runs the :func:`valid_moves_bb` flood for both sides in the same loop,
+    sharing the empty-square mask and the per-direction shifts and masks.
+    """
+
+    empty = ~(own | opp) & MASK64
+    own_moves = uint64(0)
+    opp_moves = uint64(0)
+    for i in range(4):
+        shift = _SHIFTS[i]
+        left = _LEFT_MASKS[i]
+        right = _RIGHT_MASKS[i]
+
+        own_run = opp & (own << shift) & left
+        opp_run = own & (opp << shift) & left
+        own_run |= opp & (own_run << shift) & left
+        opp_run |= own & (opp_run << shift) & left
+        own_run |= opp & (own_run << shift) & left
+        opp_run |= own & (opp_run << shift) & left
+        own_run |= opp & (own_run << shift) & left
+        opp_run |= own & (opp_run << shift) & left
+        own_run |= opp & (own_run << shift) & left
+        opp_run |= own & (opp_run << shift) & left
+        own_run |= opp & (own_run << shift) & left
+        opp_run |= own & (opp_run << shift) & left
+        own_moves |= (own_run << shift) & left
+        opp_moves |= (opp_run << shift) & left
+
+        own_run = opp & (own >> shift) & right
+        opp_run = own & (opp >> shift) & right
+        own_run |= opp & (own_run >> shift) & right
+        opp_run |= own & (opp_run >> shift) & right
+        own_run |= opp & (own_run >> shift) & right
+        opp_run |= own & (opp_run >> shift) & right
+        own_run |= opp & (own_run >> shift) & right
+        opp_run |= own & (opp_run >> shift) & right
+        own_run |= opp & (own_run >> shift) & right
+        opp_run |= own & (opp_run >> shift) & right
+        own_run |= opp & (own_run >> shift) & right
+        opp_run |= own & (opp_run >> shift) & right
+        own_moves |= (own_run >> shift) & right
+        opp_moves |= (opp_run >> shift) & right
+    return popcount(own_moves & empty), popcount(opp_moves & empty)
+
+
+@njit("uint64(uint64, uint64, int64)", cache=True, nogil=True)
+def flips_bb(own, opp, square):
+    """Return the bitboard of discs flipped by playing ``square``.
+
+    Uses the precomputed rays: along each ray the first square not
+    holding an opponent disc is the lowest (or, on rays towards lower
+    squares, highest) set bit of ``ray & ~opp``. If that square holds one of
+    our discs, the opponent discs in between are flipped.
+    """
+
+    if (own | opp) & (uint64(1) << uint64(square)):
+        return uint64(0)
+
+    flips = uint64(0)
+    for k in range(_UP_COUNTS[square]):
+        ray = _UP_RAYS[square * 4 + k]
+        blockers = ray & ~opp
+        first = blockers & (~blockers + uint64(1))
+        if first & own:
+            flips |= ray & (first - uint64(1))
+    for k in range(_DOWN_COUNTS[square]):
+        ray = _DOWN_RAYS[square * 4 + k]
+        blockers = ray & ~opp
+        blockers |= blockers >> uint64(1)
+        blockers |= blockers >> uint64(2)
+        blockers |= blockers >> uint64(4)
+        blockers |= blockers >> uint64(8)
+        blockers |= blockers >> uint64(16)
+        blockers |= blockers >> uint64(32)
+        first = blockers ^ (blockers >> uint64(1))
+        if first & own:
+            flips |= ray & ~blockers
+    return flips
+
+
+@njit("int64(uint64, uint64, int64[:], uint64[:])", cache=True, nogil=True)
+def evaluate(own, opp, weights, masks):
+    """Return the weighted positional score of the board for ``own``.
+
+    ``weights`` and ``masks`` come from :func:`weight_classes`.
+    """
+    score = 0
+    for i in range(len(weights)):
+        score += weights[i] * (popcount(own & masks[i]) - popcount(opp & masks[i]))
+    return score
+
+
+@njit("int64(uint64, uint64, int64, int64, int64, int64[:], uint64[:])", cache=True, nogil=True)
+def negamax(own, opp, depth, alpha, beta, weights, masks):
+    """Return the alpha-beta negamax score of the position for ``own``.
+
+    Leaves are scored with :func:`evaluate` using ``weights`` and ``masks``.
+    """
+
+    if depth <= 0:
+        return evaluate(own, opp, weights, masks)
+
+    moves = valid_moves_bb(own, opp)
+    if not moves:
+        if not valid_moves_bb(opp, own):
+            return (popcount(own) - popcount(opp)) * FINAL_DISC_WEIGHT
+        return -negamax(opp, own, depth, -beta, -alpha, weights, masks)
+
+    best = -INFINITY
+    for tier in range(3):
+        remaining = moves & _ORDER[tier]
+        while remaining:
+            move = remaining & (~remaining + uint64(1))
+            remaining ^= move
+            flips = flips_bb(own, opp, popcount(move - uint64(1)))
+            score = -negamax(
+                opp ^ flips, own | flips | move, depth - 1, -beta, -alpha, weights, masks
+            )
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        return best
+    return best
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from .board import Board, opponent
+from ._fast import FINAL_DISC_WEIGHT, HAVE_NUMBA, INFINITY, negamax, popcount, weight_classes
+from .board import BLACK, Board, _flips_bb, _squares, _valid_moves_bb
 
 Move = Tuple[int, int]
 
@@ -21,36 +22,189 @@ POSITION_WEIGHTS: Tuple[Tuple[int, ...], ...] = (
     (100, -20, 10, 5, 5, 10, -20, 100),
 )
 
+# The same weights indexed by square (``row * 8 + col``).
+POSITION_WEIGHTS_FLAT: Tuple[int, ...] = tuple(weight for row in POSITION_WEIGHTS for weight in row)
+
+# Leaves are scored by popcounting the squares of each distinct weight.
+_WEIGHTS, _WEIGHT_MASKS = weight_classes(POSITION_WEIGHTS_FLAT)
+
+# At or below this remaining depth the search hands over to the compiled
+# kernel, which skips the transposition table. Without numba the kernel is
+# only used to score the leaves.
+_FAST_SEARCH_DEPTH = 2 if HAVE_NUMBA else 0
+
+# Zobrist keys: one random 64-bit key per (square, colour) plus one for the
+# side to move. A fixed seed keeps hashes reproducible between runs.
+_zobrist_rng = random.Random(0x07E110)
+ZOBRIST: Tuple[Tuple[int, int], ...] = tuple(
+    (_zobrist_rng.getrandbits(64), _zobrist_rng.getrandbits(64)) for _ in range(64)
+)
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+# XOR-ing a square's flip key swaps the colour of the disc on it.
+_ZOBRIST_FLIP: Tuple[int, ...] = tuple(black ^ white for black, white in ZOBRIST)
+
+# Transposition table entry flags.
+EXACT = 0
+LOWER = 1
+UPPER = 2
+# The table is dropped once it grows past this many positions.
+_TABLE_LIMIT = 1 << 20
+
+
+def zobrist_hash(black: int, white: int, side: int) -> int:
+    """Return the Zobrist key of a position; ``side`` is 0 for black, 1 for white."""
+    keys = ZOBRIST
+    key = ZOBRIST_SIDE if side else 0
+    for square in _squares(black):
+        key ^= keys[square][0]
+    for square in _squares(white):
+        key ^= keys[square][1]
+    return key
+
+
+def _child_key(key: int, square: int, flips: int, side: int) -> int:
+    flip_keys = _ZOBRIST_FLIP
+    key ^= ZOBRIST[square][side] ^ ZOBRIST_SIDE
+    while flips:
+        lsb = flips & -flips
+        key ^= flip_keys[lsb.bit_length() - 1]
+        flips ^= lsb
+    return key
+
 
 @dataclass
 class HeuristicAI:
-    """A lightweight opponent powered by a static evaluation function."""
+    """An opponent searching ``depth`` plies ahead with negamax and alpha-beta pruning.
+
+    With ``depth`` of 1 or less the AI falls back to a static evaluation of
+    each candidate move.
+    """
 
     randomness: float = 0.0
+    depth: int = 4
     rng: random.Random = field(init=False, repr=False, default_factory=random.Random)
+    # Transposition table: Zobrist key -> (depth, flag, value, best square).
+    _table: Dict[int, Tuple[int, int, int, int]] = field(
+        init=False, repr=False, default_factory=dict
+    )
 
     def choose_move(self, board: Board, color: str) -> Optional[Move]:
         moves = board.valid_moves(color)
         if not moves:
             return None
 
-        scored_moves = [(self._evaluate_move(board, color, move), move) for move in moves]
-        scored_moves.sort(key=lambda item: item[0], reverse=True)
-
-        if self.randomness > 0 and len(scored_moves) > 1:
+        if self.randomness > 0 and len(moves) > 1:
             threshold = max(0.0, min(1.0, self.randomness))
             if self.rng.random() < threshold:
-                return self.rng.choice([move for _, move in scored_moves])
+                return self.rng.choice(moves)
+
+        if self.depth <= 1:
+            return max(moves, key=lambda move: self._evaluate_move(board, color, move))
+
+        side = 0 if color == BLACK else 1
+        if side == 0:
+            own, opp = board.black_bb, board.white_bb
+        else:
+            own, opp = board.white_bb, board.black_bb
+        key = zobrist_hash(board.black_bb, board.white_bb, side)
+        if len(self._table) > _TABLE_LIMIT:
+            self._table.clear()
+
+        # Searching the statically best moves first tightens the window early.
+        moves.sort(key=lambda move: self._evaluate_move(board, color, move), reverse=True)
+        best_move = moves[0]
+        alpha = -INFINITY
+        for row, col in moves:
+            square = row * 8 + col
+            flips = _flips_bb(own, opp, square)
+            score = -self._negamax(
+                opp & ~flips,
+                own | flips | (1 << square),
+                1 - side,
+                _child_key(key, square, flips, side),
+                self.depth - 1,
+                -INFINITY,
+                -alpha,
+            )
+            if score > alpha:
+                alpha = score
+                best_move = (row, col)
+        return best_move
+
+    def _negamax(
+        self, own: int, opp: int, side: int, key: int, depth: int, alpha: int, beta: int
+    ) -> int:
+        """Return the negamax score of the position for the side owning ``own``.
+
+        ``side`` is the colour to move (0 for black, 1 for white) and ``key``
+        the position's Zobrist hash.
+        """
+        if depth <= _FAST_SEARCH_DEPTH:
+            return negamax(own, opp, depth, alpha, beta, _WEIGHTS, _WEIGHT_MASKS)
+
+        table = self._table
+        search = self._negamax
+        original_alpha = alpha
+        best_square = -1
+        entry = table.get(key)
+        if entry is not None:
+            entry_depth, flag, value, best_square = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        moves = _valid_moves_bb(own, opp)
+        if not moves:
+            if not _valid_moves_bb(opp, own):
+                return (popcount(own) - popcount(opp)) * FINAL_DISC_WEIGHT
+            return -search(opp, own, 1 - side, key ^ ZOBRIST_SIDE, depth, -beta, -alpha)
+
+        ordered = sorted(_squares(moves), key=POSITION_WEIGHTS_FLAT.__getitem__, reverse=True)
+        if best_square >= 0 and moves >> best_square & 1:
+            ordered.remove(best_square)
+            ordered.insert(0, best_square)
+
+        best = -INFINITY
+        for square in ordered:
+            flips = _flips_bb(own, opp, square)
+            score = -search(
+                opp & ~flips,
+                own | flips | (1 << square),
+                1 - side,
+                _child_key(key, square, flips, side),
+                depth - 1,
+                -beta,
+                -alpha,
+            )
+            if score > best:
+                best = score
+                best_square = square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
 
-        return scored_moves[0][1]
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        table[key] = (depth, flag, best, best_square)
+        return best
 
-    def _evaluate_move(self, board: Board, color: str, move: Move) -> float:
+    def _evaluate_move(self, board: Board, color: str, move: Move) -> int:
         row, col = move
-        clone = board.clone()
-        flipped = clone.apply_move(row, col, color)
-        mobility = len(clone.valid_moves(color)) - len(clone.valid_moves(opponent(color)))
-        return (
-            float(POSITION_WEIGHTS[row][col])
-            + flipped * 5.0
-            + mobility * 0.5
-        )
+        saved = board.snapshot()
+        flipped = board.apply_move(row, col, color)
+        own_moves, opp_moves = board.mobility(color)
+        mobility = own_moves - opp_moves
+        board.restore(saved)
+        # Every term is doubled so that the half-weighted mobility stays integral.
+        return 2 * POSITION_WEIGHTS_FLAT[row * 8 + col] + 10 * flipped + mobility
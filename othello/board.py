@@ -1,8 +1,17 @@
-"""Core board representation for the Othello game."""
+"""Core board representation for the Othello game.
+
+The board is stored as a pair of 64-bit bitboards, one per colour, where bit
+``row * 8 + col`` is set when that square holds a disc of the colour.
+"""
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import ClassVar, Dict, List, Tuple
+
+from ._fast import MASK64, flips_bb, mobility, popcount, valid_moves_bb
+
+SIZE = 8
 
 BLACK = "B"
 WHITE = "W"
@@ -19,6 +28,46 @@ DIRECTIONS: Tuple[Tuple[int, int], ...] = (
     (1, 1),
 )
 
+# Positions recur constantly while the AI scores candidate moves, so move
+# generation and flip computation are memoised on the bitboard pair.
+_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _valid_moves_bb(own: int, opp: int) -> int:
+    """Return the bitboard of legal moves for the player owning ``own``."""
+    return int(valid_moves_bb(own, opp))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _flips_bb(own: int, opp: int, square: int) -> int:
+    """Return the bitboard of discs flipped by playing ``square``."""
+    return int(flips_bb(own, opp, square))
+
+
+def _squares(bb: int) -> List[int]:
+    """Return the indices of the set bits of ``bb`` in ascending order."""
+
+    squares: List[int] = []
+    while bb:
+        lsb = bb & -bb
+        squares.append(lsb.bit_length() - 1)
+        bb ^= lsb
+    return squares
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _move_list(moves: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the ``(row, col)`` pairs of a move bitboard, in row-major order."""
+    return tuple(divmod(square, 8) for square in _squares(moves))
+
+
+def clear_move_cache() -> None:
+    """Drop all memoised move-generation results."""
+    _valid_moves_bb.cache_clear()
+    _flips_bb.cache_clear()
+    _move_list.cache_clear()
+
 
 class InvalidMoveError(ValueError):
     """Raised when a move cannot legally be played on the board."""
@@ -26,66 +75,76 @@ class InvalidMoveError(ValueError):
 
 @dataclass
 class Board:
-    """Representation of an 8x8 Othello board."""
+    """Representation of an 8x8 Othello board.
 
-    size: int = 8
+    Discs are held in the ``black_bb`` and ``white_bb`` bitboards.
+    """
+
+    # The board is always 8x8; ``size`` remains for callers that read it.
+    size: ClassVar[int] = SIZE
 
     def __post_init__(self) -> None:
-        self._grid: List[List[str]] = [[EMPTY for _ in range(self.size)] for _ in range(self.size)]
         self.reset()
 
     def reset(self) -> None:
         """Reset the board to the initial game state."""
-        for row in range(self.size):
-            for col in range(self.size):
-                self._grid[row][col] = EMPTY
-
-        middle = self.size // 2
-        self._grid[middle - 1][middle - 1] = WHITE
-        self._grid[middle][middle] = WHITE
-        self._grid[middle - 1][middle] = BLACK
-        self._grid[middle][middle - 1] = BLACK
+        self.black_bb: int = (1 << 28) | (1 << 35)
+        self.white_bb: int = (1 << 27) | (1 << 36)
 
     def clone(self) -> "Board":
         """Return a copy of the board."""
-        new_board = Board(self.size)
-        new_board._grid = [row[:] for row in self._grid]
+        new_board = object.__new__(Board)
+        new_board.black_bb = self.black_bb
+        new_board.white_bb = self.white_bb
         return new_board
 
+    def snapshot(self) -> Tuple[int, int]:
+        """Return an immutable snapshot of the discs, for use with :meth:`restore`."""
+        return self.black_bb, self.white_bb
+
+    def restore(self, snapshot: Tuple[int, int]) -> None:
+        """Undo all moves made since ``snapshot`` was taken."""
+        self.black_bb, self.white_bb = snapshot
+
     def in_bounds(self, row: int, col: int) -> bool:
-        return 0 <= row < self.size and 0 <= col < self.size
+        return 0 <= row < 8 and 0 <= col < 8
 
     def get(self, row: int, col: int) -> str:
-        if not self.in_bounds(row, col):
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise IndexError("Position outside of the board")
+        bit = 1 << (row * 8 + col)
+        if self.black_bb & bit:
+            return BLACK
+        if self.white_bb & bit:
+            return WHITE
+        return EMPTY
+
+    def set(self, row: int, col: int, color: str) -> None:
+        """Overwrite a single square without applying any game rules."""
+        if not (0 <= row < 8 and 0 <= col < 8):
             raise IndexError("Position outside of the board")
-        return self._grid[row][col]
-
-    def _captures_from(self, row: int, col: int, color: str) -> List[Tuple[int, int]]:
-        if self._grid[row][col] != EMPTY:
-            return []
-
-        captured: List[Tuple[int, int]] = []
-        for d_row, d_col in DIRECTIONS:
-            line: List[Tuple[int, int]] = []
-            r, c = row + d_row, col + d_col
-            while self.in_bounds(r, c) and self._grid[r][c] == opponent(color):
-                line.append((r, c))
-                r += d_row
-                c += d_col
-            if line and self.in_bounds(r, c) and self._grid[r][c] == color:
-                captured.extend(line)
-        return captured
+        if color not in (BLACK, WHITE, EMPTY):
+            raise ValueError(f"Unknown disc colour: {color}")
+        bit = 1 << (row * 8 + col)
+        self.black_bb &= ~bit
+        self.white_bb &= ~bit
+        if color == BLACK:
+            self.black_bb |= bit
+        elif color == WHITE:
+            self.white_bb |= bit
+
+    def _sides(self, color: str) -> Tuple[int, int]:
+        """Return the ``(own, opponent)`` bitboards for ``color``."""
+        if color == BLACK:
+            return self.black_bb, self.white_bb
+        if color == WHITE:
+            return self.white_bb, self.black_bb
+        raise ValueError(f"Unknown disc colour: {color}")
 
     def valid_moves(self, color: str) -> List[Tuple[int, int]]:
         """Return a list of legal moves for ``color``."""
-        moves: List[Tuple[int, int]] = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self._grid[row][col] != EMPTY:
-                    continue
-                if self._captures_from(row, col, color):
-                    moves.append((row, col))
-        return moves
+        own, opp = self._sides(color)
+        return list(_move_list(_valid_moves_bb(own, opp)))
 
     def apply_move(self, row: int, col: int, color: str) -> int:
         """Place a disc on the board and flip captured discs.
@@ -102,46 +161,58 @@ class Board:
             InvalidMoveError: If the move is illegal.
         """
 
-        captured = self._captures_from(row, col, color)
-        if not captured:
+        own, opp = self._sides(color)
+        square = row * 8 + col
+        flips = _flips_bb(own, opp, square) if 0 <= row < 8 and 0 <= col < 8 else 0
+        if not flips:
             raise InvalidMoveError(f"Illegal move at ({row}, {col}) for {color}.")
 
-        self._grid[row][col] = color
-        for r, c in captured:
-            self._grid[r][c] = color
-        return len(captured)
+        own |= flips | (1 << square)
+        opp &= ~flips
+        if color == BLACK:
+            self.black_bb, self.white_bb = own, opp
+        else:
+            self.white_bb, self.black_bb = own, opp
+        return popcount(flips)
+
+    def mobility(self, color: str) -> Tuple[int, int]:
+        """Return the number of legal moves for ``color`` and for its opponent."""
+        own, opp = self._sides(color)
+        return mobility(own, opp)
 
     def has_any_valid_move(self, color: str) -> bool:
-        for row in range(self.size):
-            for col in range(self.size):
-                if self._grid[row][col] == EMPTY and self._captures_from(row, col, color):
-                    return True
-        return False
+        own, opp = self._sides(color)
+        return _valid_moves_bb(own, opp) != 0
 
     def is_full(self) -> bool:
-        return all(cell != EMPTY for row in self._grid for cell in row)
+        return (self.black_bb | self.white_bb) == MASK64
 
     def score(self) -> Dict[str, int]:
-        counts = {BLACK: 0, WHITE: 0, EMPTY: 0}
-        for row in self._grid:
-            for cell in row:
-                counts[cell] += 1
-        return counts
+        black = popcount(self.black_bb)
+        white = popcount(self.white_bb)
+        return {BLACK: black, WHITE: white, EMPTY: 64 - black - white}
 
     def to_lines(self) -> List[str]:
-        header = "  " + " ".join(chr(ord("a") + i) for i in range(self.size))
+        black, white = self.black_bb, self.white_bb
+        header = "  " + " ".join(chr(ord("a") + i) for i in range(8))
         lines = [header]
-        for idx, row in enumerate(self._grid, 1):
-            lines.append(f"{idx} " + " ".join(row))
+        for row in range(8):
+            cells = []
+            for col in range(8):
+                bit = 1 << (row * 8 + col)
+                cells.append(BLACK if black & bit else WHITE if white & bit else EMPTY)
+            lines.append(f"{row + 1} " + " ".join(cells))
         return lines
 
     def __str__(self) -> str:  # pragma: no cover - trivial formatting
         return "\n".join(self.to_lines())
 
 
+_OPPONENT: Dict[str, str] = {BLACK: WHITE, WHITE: BLACK}
+
+
 def opponent(color: str) -> str:
-    if color == BLACK:
-        return WHITE
-    if color == WHITE:
-        return BLACK
-    raise ValueError(f"Unknown disc colour: {color}")
+    try:
+        return _OPPONENT[color]
+    except KeyError:
+        raise ValueError(f"Unknown disc colour: {color}") from None
@@ -87,13 +87,19 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=0.2,
         help="Probability of the AI selecting a sub-optimal move.",
     )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=4,
+        help="Number of plies the AI searches ahead.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
     args = parse_args(argv)
 
-    ai = HeuristicAI(randomness=args.randomness)
+    ai = HeuristicAI(randomness=args.randomness, depth=args.depth)
     ai_sides = {
         "black": {BLACK},
         "white": {WHITE},
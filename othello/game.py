@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
-from .board import BLACK, WHITE, Board, InvalidMoveError, opponent
+from .board import BLACK, WHITE, Board, InvalidMoveError, clear_move_cache, opponent
 
 Move = Tuple[int, int]
 
@@ -36,6 +36,9 @@ class OthelloGame:
     finished: bool = False
     winner: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        clear_move_cache()
+
     def valid_moves(self) -> List[Move]:
         return self.board.valid_moves(self.current_player)
 
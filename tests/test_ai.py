@@ -0,0 +1,101 @@
+import random
+
+from othello._fast import FINAL_DISC_WEIGHT, evaluate, popcount
+from othello.ai import POSITION_WEIGHTS, HeuristicAI, _WEIGHT_MASKS, _WEIGHTS, _child_key, zobrist_hash
+from othello.board import BLACK, WHITE, Board, EMPTY, _flips_bb, _squares, _valid_moves_bb
+from othello.game import OthelloGame
+
+
+def _minimax(own, opp, depth):
+    """Unpruned reference search used to check alpha-beta results."""
+    if depth <= 0:
+        return evaluate(own, opp, _WEIGHTS, _WEIGHT_MASKS)
+    moves = _valid_moves_bb(own, opp)
+    if not moves:
+        if not _valid_moves_bb(opp, own):
+            return (popcount(own) - popcount(opp)) * FINAL_DISC_WEIGHT
+        return -_minimax(opp, own, depth)
+    scores = []
+    for square in _squares(moves):
+        flips = _flips_bb(own, opp, square)
+        scores.append(-_minimax(opp & ~flips, own | flips | (1 << square), depth - 1))
+    return max(scores)
+
+
+def test_choose_move_returns_legal_move():
+    board = Board()
+    ai = HeuristicAI()
+    assert ai.choose_move(board, BLACK) in board.valid_moves(BLACK)
+
+
+def test_choose_move_without_moves_returns_none():
+    board = Board()
+    for row in range(board.size):
+        for col in range(board.size):
+            board.set(row, col, BLACK)
+    assert HeuristicAI().choose_move(board, WHITE) is None
+
+
+def test_ai_takes_available_corner():
+    board = Board()
+    for row in range(board.size):
+        for col in range(board.size):
+            board.set(row, col, EMPTY)
+    board.set(0, 1, WHITE)
+    board.set(0, 2, BLACK)
+    board.set(3, 3, WHITE)
+    board.set(3, 4, BLACK)
+
+    assert HeuristicAI(depth=3).choose_move(board, BLACK) == (0, 0)
+
+
+def test_ai_plays_full_game():
+    game = OthelloGame()
+    ai = HeuristicAI(depth=2)
+    while not game.finished:
+        game.play_turn(ai.choose_move(game.board, game.current_player))
+    assert game.winner in {BLACK, WHITE, None}
+
+
+def test_evaluate_matches_weighted_square_sum():
+    rng = random.Random(3)
+    for _ in range(50):
+        own = rng.getrandbits(64)
+        opp = rng.getrandbits(64) & ~own
+        expected = 0
+        for square in range(64):
+            weight = POSITION_WEIGHTS[square // 8][square % 8]
+            if own >> square & 1:
+                expected += weight
+            elif opp >> square & 1:
+                expected -= weight
+        assert evaluate(own, opp, _WEIGHTS, _WEIGHT_MASKS) == expected
+
+
+def test_alpha_beta_matches_unpruned_search():
+    rng = random.Random(7)
+    board = Board()
+    color = BLACK
+    for _ in range(20):
+        moves = board.valid_moves(color)
+        if not moves:
+            break
+        board.apply_move(*rng.choice(moves), color)
+        color = WHITE if color == BLACK else BLACK
+        side = 0 if color == BLACK else 1
+        own, opp = board.black_bb, board.white_bb
+        if side:
+            own, opp = opp, own
+        key = zobrist_hash(board.black_bb, board.white_bb, side)
+        expected = _minimax(own, opp, 3)
+        assert HeuristicAI()._negamax(own, opp, side, key, 3, -(1 << 40), 1 << 40) == expected
+
+
+def test_zobrist_key_is_updated_incrementally():
+    board = Board()
+    key = zobrist_hash(board.black_bb, board.white_bb, 0)
+    flips = _flips_bb(board.black_bb, board.white_bb, 2 * 8 + 3)
+    board.apply_move(2, 3, BLACK)
+    assert _child_key(key, 2 * 8 + 3, flips, 0) == zobrist_hash(
+        board.black_bb, board.white_bb, 1
+    )
@@ -1,6 +1,6 @@
 import pytest
 
-from othello.board import BLACK, WHITE, Board, EMPTY, InvalidMoveError
+from othello.board import BLACK, WHITE, Board, EMPTY, InvalidMoveError, opponent
 
 
 def test_initial_board_setup():
@@ -49,17 +49,75 @@ def test_has_any_valid_move():
 
     for row in range(board.size):
         for col in range(board.size):
-            board._grid[row][col] = BLACK
-    board._grid[3][3] = WHITE
-    board._grid[3][4] = EMPTY
+            board.set(row, col, BLACK)
+    board.set(3, 3, WHITE)
+    board.set(3, 4, EMPTY)
 
     assert board.has_any_valid_move(BLACK)
     assert not board.has_any_valid_move(WHITE)
 
 
+def test_mobility_counts_both_sides():
+    board = Board()
+    assert board.mobility(BLACK) == (4, 4)
+    board.apply_move(2, 3, BLACK)
+    assert board.mobility(WHITE) == (len(board.valid_moves(WHITE)), len(board.valid_moves(BLACK)))
+
+
 def test_clone_creates_independent_board():
     board = Board()
     clone = board.clone()
     clone.apply_move(2, 3, BLACK)
     assert board.get(2, 3) == EMPTY
     assert clone.get(2, 3) == BLACK
+
+
+def test_restore_undoes_moves():
+    board = Board()
+    saved = board.snapshot()
+    board.apply_move(2, 3, BLACK)
+    board.apply_move(2, 2, WHITE)
+    board.restore(saved)
+    assert board.snapshot() == Board().snapshot()
+    assert board.get(2, 3) == EMPTY
+    assert board.get(3, 3) == WHITE
+
+
+def test_apply_move_flips_in_several_directions():
+    board = Board()
+    for row in range(board.size):
+        for col in range(board.size):
+            board.set(row, col, EMPTY)
+    board.set(0, 0, BLACK)
+    board.set(1, 1, WHITE)
+    board.set(0, 7, BLACK)
+    board.set(1, 6, WHITE)
+    board.set(2, 3, WHITE)
+    board.set(2, 4, WHITE)
+    board.set(2, 5, WHITE)
+    board.set(2, 6, WHITE)
+    board.set(2, 7, BLACK)
+
+    assert (2, 2) in board.valid_moves(BLACK)
+    flipped = board.apply_move(2, 2, BLACK)
+
+    assert flipped == 5
+    assert board.get(1, 1) == BLACK
+    assert all(board.get(2, col) == BLACK for col in range(2, 8))
+    assert board.get(1, 6) == WHITE
+
+
+def test_opponent():
+    assert opponent(BLACK) == WHITE
+    assert opponent(WHITE) == BLACK
+    with pytest.raises(ValueError):
+        opponent(EMPTY)
+
+
+def test_set_with_unknown_colour_leaves_board_unchanged():
+    board = Board()
+    saved = board.snapshot()
+    with pytest.raises(ValueError):
+        board.set(3, 3, "X")
+    assert board.snapshot() == saved
+    assert board.get(3, 3) == WHITE
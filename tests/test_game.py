@@ -23,11 +23,11 @@ def test_forced_pass_is_recorded():
     board = game.board
     for row in range(board.size):
         for col in range(board.size):
-            board._grid[row][col] = BLACK
-    board._grid[4][5] = WHITE
-    board._grid[5][3] = WHITE
-    board._grid[5][4] = EMPTY
-    board._grid[5][5] = EMPTY
+            board.set(row, col, BLACK)
+    board.set(4, 5, WHITE)
+    board.set(5, 3, WHITE)
+    board.set(5, 4, EMPTY)
+    board.set(5, 5, EMPTY)
 
     game.current_player = BLACK
     game.history.clear()
@@ -46,11 +46,11 @@ def test_game_finishes_when_board_full():
     board = game.board
     for row in range(board.size):
         for col in range(board.size):
-            board._grid[row][col] = BLACK
-    board._grid[0][0] = WHITE
-    board._grid[0][1] = EMPTY
-    board._grid[0][2] = BLACK
-    board._grid[0][3] = WHITE
+            board.set(row, col, BLACK)
+    board.set(0, 0, WHITE)
+    board.set(0, 1, EMPTY)
+    board.set(0, 2, BLACK)
+    board.set(0, 3, WHITE)
 
     game.current_player = WHITE
     game.finished = False